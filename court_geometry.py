@@ -5,6 +5,7 @@ Court geometry + figure builder for the 3D half-court in Plotly.
 # --- Imports
 import numpy as np
 import plotly.graph_objects as go
+import streamlit as st
 
 # --- Court constants (feet)   matches NBA diagram
 COURT_LENGTH_HALF = 47.0
@@ -77,26 +78,31 @@ def add_three_point_line(fig, width=4, color="black", z_up=0.02, full_semicircle
     R  = THREE_PT_RADIUS
     yc = THREE_PT_CORNER  # 22'
     theta0 = np.arcsin(yc / R)           # <-- correct meeting angle
-    x_meet = HOOP_X + R * np.cos(theta0) # x where arc meets the straight lines
+    # (the arc endpoints themselves sit at the corner-line join, x = HOOP_X + R*cos(theta0))
 
-    # Arc
+    # Arc (181 points is visually indistinguishable from 721 at app camera
+    # distances and keeps the WebGL vertex budget down)
     if full_semicircle:
-        th = np.linspace(-np.pi/2, np.pi/2, 901)
-    else:
-        th = np.linspace(-theta0, theta0, 721)
-
+        th = np.linspace(-np.pi/2, np.pi/2, 361)
+        x_arc = HOOP_X + R * np.cos(th)
+        y_arc = HOOP_Y + R * np.sin(th)
+        fig.add_trace(line3d(x_arc, y_arc, np.full_like(th, z_up), width=width, color=color))
+        return
+
+    # Corners + arc merged into ONE polyline:
+    # baseline -> join point -> arc -> join point -> baseline
+    th = np.linspace(-theta0, theta0, 181)
     x_arc = HOOP_X + R * np.cos(th)
     y_arc = HOOP_Y + R * np.sin(th)
-    z_arc = np.full_like(th, z_up)
-    fig.add_trace(line3d(x_arc, y_arc, z_arc, width=width, color=color))
-
-    # Corner straight segments (baseline to join point)
-    if not full_semicircle:
-        fig.add_trace(line3d([0, x_meet], [ yc,  yc], [z_up, z_up], width=width, color=color))
-        fig.add_trace(line3d([0, x_meet], [-yc, -yc], [z_up, z_up], width=width, color=color))
+    xs = np.concatenate(([0.0], x_arc, [0.0]))
+    ys = np.concatenate(([-yc], y_arc, [yc]))
+    fig.add_trace(line3d(xs, ys, np.full_like(xs, z_up), width=width, color=color))
 
 
-# ---- NEW: one function that builds the court and returns a Figure
+# ---- NEW: one function that builds the court and returns a Figure.
+# The court never changes, so build it once per argument set and let callers
+# clone it (go.Figure(cached)) before adding their own traces.
+@st.cache_resource(show_spinner=False)
 def build_court_figure(
     floor_opacity=0.55,
     show_full_3pt_semicircle=False,
@@ -111,7 +117,7 @@ def build_court_figure(
     fig.add_trace(rectangle_outline3d(0, FT_LINE_X, -PAINT_WIDTH/2, PAINT_WIDTH/2, width=4))
 
     # Free-throw (top) & restricted arcs
-    theta = np.linspace(-np.pi/2, np.pi/2, 240)
+    theta = np.linspace(-np.pi/2, np.pi/2, 96)
     fig.add_trace(line3d(FT_LINE_X + 6*np.cos(theta), 6*np.sin(theta), np.zeros_like(theta), width=4))
     fig.add_trace(line3d(HOOP_X + 4*np.cos(theta),   4*np.sin(theta), np.zeros_like(theta), width=4))
 
@@ -119,13 +125,16 @@ def build_court_figure(
     add_three_point_line(fig, width=4, z_up=0.02, full_semicircle=show_full_3pt_semicircle)
 
     # Rim + backboard
-    fig.add_trace(circle3d(HOOP_X, HOOP_Y, RIM_HEIGHT, RIM_RADIUS, n=256, color="#111", width=8))
+    fig.add_trace(circle3d(HOOP_X, HOOP_Y, RIM_HEIGHT, RIM_RADIUS, n=64, color="#111", width=8))
     bb_fill, bb_edge = backboard_mesh()
     fig.add_trace(bb_fill); fig.add_trace(bb_edge)
 
     # Layout / camera
     fig.update_layout(
         showlegend=False,
+        # stable revision: Plotly keeps the user's camera/zoom across reruns
+        # instead of tearing down and re-initializing the WebGL scene
+        uirevision="court",
         scene=dict(
             xaxis=dict(title="x (ft)", range=[0, COURT_LENGTH_HALF], showgrid=False, zeroline=False, backgroundcolor="white"),
             yaxis=dict(title="y (ft)", range=[-COURT_WIDTH/2, COURT_WIDTH/2], showgrid=False, zeroline=False, backgroundcolor="white"),
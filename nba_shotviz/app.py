@@ -5,8 +5,8 @@ Streamlit app wrapper for the 3D NBA shot visualization.
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-from src.viz_3d import render_3d_trajectories
 from src.filters import default_filter_state, filter_df
 from src.data_io import get_available_players, get_available_seasons, load_shotlog, load_shotlog_multi, get_name_to_id
 
@@ -52,30 +52,16 @@ if "loaded_key" not in st.session_state:
 with st.sidebar.form("dataset_picker"):
     sel_player = st.selectbox("Player", available_players, index=0)
 
-    latest_idx = len(available_seasons) - 1
-    default_season = available_seasons[latest_idx]
-
-    season_min = st.selectbox(
-        "Season (min)",
-        available_seasons,
-        index=available_seasons.index(st.session_state.season_min),
-    )
-    season_max = st.selectbox(
-        "Season (max)",
-        available_seasons,
-        index=available_seasons.index(st.session_state.season_max),
+    # one widget, one rerun per adjustment; the tuple comes back ordered so
+    # the old min>max validation branch is unnecessary
+    season_min, season_max = st.select_slider(
+        "Season range",
+        options=available_seasons,
+        value=(st.session_state.season_min, st.session_state.season_max),
     )
 
     submitted = st.form_submit_button("Update Visualization")
 
-min_i = available_seasons.index(season_min)
-max_i = available_seasons.index(season_max)
-if min_i > max_i:
-    st.error("🚫 Invalid season range: Season (min) must be earlier than Season (max).")
-    st.stop()
-
-selected_seasons = available_seasons[min_i : max_i + 1]
-
 st.session_state.season_min = season_min
 st.session_state.season_max = season_max
 
@@ -93,19 +79,12 @@ rg = st.sidebar.checkbox("Color arcs red/green", value=True)
 
 ha = st.sidebar.radio("Venue", ["All", "Home", "Away"], index=0, horizontal=True,) #mxngo
 
-st.sidebar.markdown("Quarters")
-
-q1 = st.sidebar.checkbox("Q1", value=True)
-q2 = st.sidebar.checkbox("Q2", value=True)
-q3 = st.sidebar.checkbox("Q3", value=True)
-q4 = st.sidebar.checkbox("Q4", value=True)
-ot = st.sidebar.checkbox("OT", value=True)
-periods = []
-if q1: periods.append(1)
-if q2: periods.append(2)
-if q3: periods.append(3)
-if q4: periods.append(4)
-if ot: periods.append(5)
+# One multiselect instead of five checkboxes: one widget event per change
+_QUARTER_PERIODS = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4, "OT": 5}
+quarters = st.sidebar.multiselect(
+    "Quarters", list(_QUARTER_PERIODS), default=list(_QUARTER_PERIODS)
+)
+periods = [_QUARTER_PERIODS[q] for q in quarters]
 
 # clutch = st.sidebar.checkbox("Clutch shots only", value=False)
 
@@ -116,6 +95,12 @@ if ot: periods.append(5)
 requested_key = (sel_player, season_min, season_max)
 
 if submitted and requested_key != st.session_state.loaded_key:
+    # only a real submit pays for the index scans; widget-only reruns skip this
+    min_i = available_seasons.index(season_min)
+    max_i = available_seasons.index(season_max)
+    selected_seasons = available_seasons[min_i : max_i + 1]
+    st.session_state.selected_seasons = selected_seasons
+
     with st.spinner(f"Loading shot data for {sel_player} — {season_min} to {season_max}…"):
         if len(selected_seasons) > 1:
             player_df, league_df = load_shotlog_multi(sel_player, selected_seasons)
@@ -220,16 +205,25 @@ headshot_url = None
 if pid is not None:
     headshot_url = f"https://cdn.nba.com/headshots/nba/latest/260x190/{pid}.png"
 
+def _dropdown_options(col: pd.Series) -> list:
+    # Categorical columns (set at load time) keep their distinct values in
+    # .cat.categories, so reruns sort a tiny category list instead of
+    # re-scanning the whole column.
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        return sorted(col.cat.categories)
+    # pd.unique + np.sort stay in C for the uncommon non-categorical case
+    return list(np.sort(pd.unique(col.dropna().to_numpy())))
+
 # Action Type dropdown
 if "ACTION_TYPE" in player_df.columns:
-    action_types = ["All"] + sorted(player_df["ACTION_TYPE"].dropna().unique().tolist())
+    action_types = ["All"] + _dropdown_options(player_df["ACTION_TYPE"])
 else:
     action_types = ["All"]
 stype = st.sidebar.selectbox("Shot Type", action_types, index=0)
 
 # Opponent dropdown
 if "OPPONENT" in player_df.columns:
-    opponents = ["All"] + sorted(player_df["OPPONENT"].dropna().unique().tolist())
+    opponents = ["All"] + _dropdown_options(player_df["OPPONENT"])
 else:
     opponents = ["All"]
 opp = st.sidebar.selectbox("Opponent", opponents, index=0)
@@ -273,6 +267,10 @@ with tabs[0]:
         if df_filtered.empty:
             st.info("No shots to display. Try different filters.")
         else:
+            # Deferred so the pre-load "pick a player" screen never pays the
+            # Plotly import cost; Python caches the module afterwards.
+            from src.viz_3d import render_3d_trajectories
+
             render_3d_trajectories(
                 df_filtered,
                 league_df=league_df,
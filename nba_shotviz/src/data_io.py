@@ -5,70 +5,144 @@ Data access helpers for Streamlit app:
 - Shot log loader via nba_api (cached)
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 import streamlit as st
+from pandas.api.types import union_categoricals
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from nba_api.stats.static import players, teams
 from nba_api.stats.endpoints import shotchartdetail
+from nba_api.stats.library.http import NBAStatsHTTP
+
+# One pooled keep-alive session for every stats.nba.com call: skips the
+# per-request TLS handshake and retries transient API failures.
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+_http_session.mount("https://", _http_adapter)
+_http_session.mount("http://", _http_adapter)
+NBAStatsHTTP.set_session(_http_session)
 
 
 # 1) Single cached raw list of dictionaries for each player
-@st.cache_data(show_spinner=False)
+# (cache_resource: static lookup tables, never invalidated, no copy per hit)
+@st.cache_resource(show_spinner=False)
 def get_active_players_raw():
     # Returns list[dict] with keys like 'id', 'full_name'
     return players.get_active_players()
 
 # 2) Cached name list for UI
-@st.cache_data(show_spinner=False)
+@st.cache_resource(show_spinner=False)
 def get_available_players():
     return sorted([p["full_name"] for p in get_active_players_raw()])
 
 # 3) Cached name -> id map for instant lookups
-@st.cache_data(show_spinner=False)
+@st.cache_resource(show_spinner=False)
 def get_name_to_id():
     return {p["full_name"]: p["id"] for p in get_active_players_raw()}
 
-# 4) Seasons (unchanged; tweak start/end as you like)
-@st.cache_data(show_spinner=False)
+# 4) Seasons: 15 string literals — building them costs less than
+# st.cache_data's hash/lookup round-trip, so keep a module-level constant
+AVAILABLE_SEASONS = tuple(f"{y}-{str(y+1)[-2:]}" for y in range(2010, 2025))
+
 def get_available_seasons(start: int = 2010, end: int = 2025):
     # Produces strings like '2016-17'
+    if (start, end) == (2010, 2025):
+        return list(AVAILABLE_SEASONS)
     return [f"{y}-{str(y+1)[-2:]}" for y in range(start, end)]
 
-# mxngo) Teams 
+# mxngo) Teams: one small table indexed by TEAM_ID; a hashed reindex maps whole
+# columns in C instead of Series.map doing a Python dict lookup per element
 @st.cache_data(show_spinner=False)
-def get_team_maps():
-    tlst = teams.get_teams()
-    id2abbr  = {t["id"]: t["abbreviation"] for t in tlst}
-    abbr2full= {t["abbreviation"]: t["full_name"] for t in tlst}
-    id2full  = {t["id"]: t["full_name"] for t in tlst}
-    return id2abbr, abbr2full, id2full
+def get_teams_df() -> pd.DataFrame:
+    return pd.DataFrame(teams.get_teams()).set_index("id")[["abbreviation", "full_name"]]
 
 def _attach_venue_and_opponent(player_df: pd.DataFrame) -> pd.DataFrame:
-
+    """
+    Attach TEAM_ABBR / VENUE / OPPONENT_ABBR / OPPONENT columns.
+    Mutates and returns `player_df`: the caller (load_shotlog) owns the
+    freshly-built frame, so a defensive copy would only cost memory.
+    """
     if player_df.empty:
         return player_df
 
-    id2abbr, abbr2full, _ = get_team_maps()
+    teams_df = get_teams_df()
 
-    df = player_df.copy()
-    df["TEAM_ABBR"] = df["TEAM_ID"].map(id2abbr)
+    df = player_df
+    df["TEAM_ABBR"] = teams_df["abbreviation"].reindex(df["TEAM_ID"].to_numpy()).to_numpy()
 
-    # Venue
-    venue = pd.Series("Unknown", index=df.index)
-    venue = venue.mask(df["TEAM_ABBR"].eq(df["HTM"]), "Home")
-    venue = venue.mask(df["TEAM_ABBR"].eq(df["VTM"]), "Away")
-    df["VENUE"] = venue
+    # Venue + opponent in one vectorized pass (np.where on the raw arrays
+    # instead of chained Series.mask, which allocates per call)
+    team_abbr = df["TEAM_ABBR"].to_numpy()
+    htm = df["HTM"].to_numpy()
+    vtm = df["VTM"].to_numpy()
+    is_home = team_abbr == htm
+    is_away = team_abbr == vtm
 
-    # Opponent (abbr + full)
-    opp_abbr = pd.Series(pd.NA, index=df.index)
-    opp_abbr = opp_abbr.mask(df["VENUE"].eq("Home"), df["VTM"])
-    opp_abbr = opp_abbr.mask(df["VENUE"].eq("Away"), df["HTM"])
+    df["VENUE"] = np.where(is_home, "Home", np.where(is_away, "Away", "Unknown"))
+    opp_abbr = np.where(is_home, vtm, np.where(is_away, htm, None))
     df["OPPONENT_ABBR"] = opp_abbr
-    df["OPPONENT"] = df["OPPONENT_ABBR"].map(abbr2full)
+    full_by_abbr = teams_df.reset_index().set_index("abbreviation")["full_name"]
+    df["OPPONENT"] = full_by_abbr.reindex(opp_abbr).to_numpy()
 
     return df
 
+# Disk-backed second cache tier: st.cache_data is in-process only, so a server
+# restart would otherwise re-fetch every (player, season) over HTTPS.
+CACHE_DIR = Path(__file__).resolve().parent / ".shot_cache"
+
+
+# Low-cardinality string columns cast to category at ingest; filter masks and
+# zone groupbys then compare integer codes instead of Python strings.
+_CATEGORY_COLS = (
+    "SHOT_ZONE_BASIC", "SHOT_ZONE_AREA", "ACTION_TYPE",
+    "HTM", "VTM", "TEAM_ABBR", "OPPONENT_ABBR", "OPPONENT", "VENUE",
+)
+
+# nba_api returns every integer column as int64; these all fit in int8/int16
+# (LOC_X/Y are tenths of a foot within ±250), so downcast to cut memory and
+# bandwidth in every downstream filter/groupby pass.
+_NARROW_INT_COLS = {
+    "SHOT_MADE_FLAG": "int8",
+    "SHOT_ATTEMPTED_FLAG": "int8",
+    "PERIOD": "int8",
+    "MINUTES_REMAINING": "int8",
+    "SECONDS_REMAINING": "int8",
+    "LOC_X": "int16",
+    "LOC_Y": "int16",
+    "SHOT_DISTANCE": "int16",
+    "GAME_EVENT_ID": "int16",
+    "PLAYER_ID": "int32",
+    "TEAM_ID": "int32",
+}
+
+# Only the columns the filters and visuals actually read survive ingestion;
+# anything else just bloats the caches and every hash/serialize pass.
+_KEEP_COLS = (
+    "LOC_X", "LOC_Y", "PERIOD", "SHOT_MADE_FLAG", "SHOT_DISTANCE",
+    "ACTION_TYPE", "SHOT_ZONE_BASIC", "SHOT_ZONE_AREA", "VENUE", "OPPONENT",
+)
+
+# League-average numerics: FGA/FGM counts fit int32 and FG_PCT only needs
+# float32 precision; the heatmap rescans this frame on every grid rebuild.
+_LEAGUE_NARROW_COLS = {
+    "FGA": "int32",
+    "FGM": "int32",
+    "FG_PCT": "float32",
+}
+
+
 # 5) Shot log loader: use the cached map (O(1) lookup)
-@st.cache_data(show_spinner=True)
+@st.cache_data(persist="disk", ttl=7 * 24 * 3600, show_spinner=False, max_entries=32)
 def load_shotlog(player_name: str, season: str) -> pd.DataFrame:
     """
     Returns a DataFrame with at least columns:
@@ -80,28 +154,89 @@ def load_shotlog(player_name: str, season: str) -> pd.DataFrame:
         st.error(f"No data found for {player_name}")
         return pd.DataFrame()
 
+    p_path = CACHE_DIR / f"{pid}_{season}.parquet"
+    l_path = CACHE_DIR / f"{pid}_{season}.lg.parquet"
+    if p_path.exists() and l_path.exists():
+        try:
+            return pd.read_parquet(p_path), pd.read_parquet(l_path)
+        except Exception:
+            pass  # corrupt/partial entry: fall through and re-fetch
+
     resp = shotchartdetail.ShotChartDetail(
         team_id=0,
         player_id=pid,
         season_nullable=season,
         context_measure_simple="FGA"
     )
-    league_df = resp.get_data_frames()[1]  # league avgs
-    player_df = resp.get_data_frames()[0]  # player shots
+    # Parse the JSON payload once and build only the two result sets we use
+    # (get_data_frames() re-parses and builds a DataFrame for every set per call)
+    result_sets = resp.get_dict()["resultSets"]
+    player_df = pd.DataFrame(result_sets[0]["rowSet"], columns=result_sets[0]["headers"])  # player shots
+    league_df = pd.DataFrame(result_sets[1]["rowSet"], columns=result_sets[1]["headers"])  # league avgs
     player_df = _attach_venue_and_opponent(player_df) # teams mxngo
+    player_df = player_df[[c for c in _KEEP_COLS if c in player_df.columns]]
+    for col in _CATEGORY_COLS:
+        if col in player_df.columns:
+            player_df[col] = player_df[col].astype("category")
+    for col, dtype in _NARROW_INT_COLS.items():
+        if col in player_df.columns:
+            player_df[col] = player_df[col].astype(dtype)
+    for col, dtype in _LEAGUE_NARROW_COLS.items():
+        if col in league_df.columns:
+            league_df[col] = league_df[col].astype(dtype)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        player_df.to_parquet(p_path, compression="zstd")
+        league_df.to_parquet(l_path, compression="zstd")
+    except Exception:
+        pass  # the disk tier is best-effort; in-memory caching still applies
+
     return player_df, league_df
 
+def _concat_preserving_cats(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate season frames without losing category dtypes: pd.concat
+    silently decays mismatched category columns back to object, so union the
+    per-season category sets column by column instead.
+    """
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    out_cols = {}
+    for col in frames[0].columns:
+        if isinstance(frames[0][col].dtype, pd.CategoricalDtype):
+            out_cols[col] = union_categoricals([f[col] for f in frames], ignore_order=True)
+        else:
+            out_cols[col] = np.concatenate([f[col].to_numpy() for f in frames])
+    return pd.DataFrame(out_cols)
+
+
 # mxngo
+@st.cache_data(persist="disk", ttl=7 * 24 * 3600, show_spinner=False, max_entries=32)
 def load_shotlog_multi(player_name: str, seasons: list[str]):
     """
     Load and concatenate shot logs for a player over multiple seasons.
     Adds a SEASON column to each chunk before concatenating.
     Returns (player_df, league_df).
     """
+    if not seasons:
+        return pd.DataFrame(), pd.DataFrame()
+
+    # Seasons are independent HTTPS round-trips, so overlap the network waits
+    # with a small thread pool. Submissions are staggered slightly so we do
+    # not burst-fire requests at stats.nba.com; futures keep season order.
+    with ThreadPoolExecutor(max_workers=min(8, len(seasons))) as ex:
+        futures = []
+        for s in seasons:
+            futures.append(ex.submit(load_shotlog, player_name, s))
+            time.sleep(0.05)
+        results = [f.result() for f in futures]
+
     frames_p, frames_l = [], []
 
-    for s in seasons:
-        p, l = load_shotlog(player_name, s)
+    for s, (p, l) in zip(seasons, results):
         if not p.empty:
             p = p.assign(SEASON=s)
             frames_p.append(p)
@@ -109,8 +244,8 @@ def load_shotlog_multi(player_name: str, seasons: list[str]):
             l = l.assign(SEASON=s)
             frames_l.append(l)
 
-    player_df = pd.DataFrame() if not frames_p else pd.concat(frames_p, ignore_index=True)
-    league_df = pd.DataFrame() if not frames_l else pd.concat(frames_l, ignore_index=True)
+    player_df = _concat_preserving_cats(frames_p)
+    league_df = _concat_preserving_cats(frames_l)
 
     return player_df, league_df
 
@@ -4,7 +4,20 @@ Filtering utilities for the Streamlit 3D NBA Shot Visualization app.
 - Period-only filtering (no Home/Away for now)
 """
 
+import hashlib
+
+import numpy as np
 import pandas as pd
+import streamlit as st
+
+from .shot_index import build_shot_index
+
+
+def _hash_df(df: pd.DataFrame) -> str:
+    """Content fingerprint so the cache keys on data, not object identity."""
+    return hashlib.sha1(
+        pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+    ).hexdigest()
 
 def default_filter_state() -> dict:
     """
@@ -25,41 +38,50 @@ def default_filter_state() -> dict:
     }
 
 
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_df})
 def filter_df(df: pd.DataFrame, state: dict) -> pd.DataFrame:
     """
-    Apply period-only filtering.
+    Apply all active filters with one combined boolean mask (a single slice,
+    instead of re-copying the DataFrame per condition).
+
+    Memoized: repeating a widget combination returns the cached slice instead
+    of re-scanning the full DataFrame on every rerun. The per-value masks are
+    precomputed once per dataset (see shot_index) so each call only AND-s
+    cached boolean arrays.
     """
-    out = df.copy()
+    idx = build_shot_index(df)
+    masks = []
 
     # Period filter (only if the column exists)
-    if state.get("periods") and "PERIOD" in out.columns:
-        out = out[out["PERIOD"].isin(state["periods"])]
+    if state.get("periods") and idx.period_masks:
+        sel = [idx.period_masks[p] for p in state["periods"] if p in idx.period_masks]
+        masks.append(np.logical_or.reduce(sel) if sel else np.zeros(idx.n, dtype=bool))
 
     # Make/Miss filter mxngo
-    if state.get("result") in ("Makes", "Misses") and "SHOT_MADE_FLAG" in out.columns:
-        want = 1 if state["result"] == "Makes" else 0
-        out = out[out["SHOT_MADE_FLAG"] == want]
+    if state.get("result") in ("Makes", "Misses") and idx.make_mask is not None:
+        masks.append(idx.make_mask if state["result"] == "Makes" else idx.miss_mask)
 
     # Home/Away filter mxngo
-    if state.get("venue") in ("Home", "Away") and "VENUE" in out.columns:
-        out = out[out["VENUE"] == state["venue"]]
+    if state.get("venue") in ("Home", "Away") and "VENUE" in df.columns:
+        masks.append(idx.venue_masks.get(state["venue"], np.zeros(idx.n, dtype=bool)))
 
     # Opponent filter mxngo
-    if state.get("opponent") not in (None, "All") and "OPPONENT" in out.columns:
-        out = out[out["OPPONENT"] == state["opponent"]]
+    if state.get("opponent") not in (None, "All") and "OPPONENT" in df.columns:
+        masks.append(idx.opponent_masks.get(state["opponent"], np.zeros(idx.n, dtype=bool)))
 
     # Action Type filter mxngo
-    if state.get("action_type") not in (None, "All") and "ACTION_TYPE" in out.columns:
-        out = out[out["ACTION_TYPE"] == state["action_type"]]
+    if state.get("action_type") not in (None, "All") and "ACTION_TYPE" in df.columns:
+        masks.append(idx.action_masks.get(state["action_type"], np.zeros(idx.n, dtype=bool)))
 
     # Shot Distance filter mxngo
-    if state.get("shot_distance") and "SHOT_DISTANCE" in out.columns:
+    if state.get("shot_distance") and idx.shot_distance is not None:
         lo, hi = state["shot_distance"]
-        out = out[(out["SHOT_DISTANCE"] >= lo) & (out["SHOT_DISTANCE"] <= hi)]
+        masks.append((idx.shot_distance >= lo) & (idx.shot_distance <= hi))
 
     # # Clutch filter mxngo
-    # if state.get("clutch_only") and "CLUTCH" in out.columns:
-    #     out = out[out["CLUTCH"]]
-
+    # if state.get("clutch_only") and "CLUTCH" in df.columns:
+    #     mask &= df["CLUTCH"].to_numpy()
 
-    return out
+    if not masks:
+        return df
+    return df[np.logical_and.reduce(masks)]
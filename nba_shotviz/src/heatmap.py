@@ -4,38 +4,55 @@ Hot/Cold Zone Heatmap utilities for 3D NBA Shot Visualization.
 - Renders color-coded 3D floor surface and zone boundary outlines.
 """
 
+import hashlib
+
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import streamlit as st
 
 from .court_geometry import COURT_LENGTH_HALF, COURT_WIDTH, line3d
-from .zone_classify import classify_basic_zone, classify_area_lane
+from .zone_classify_numba import classify_grid
 from .zone_tables import league_zone_fg_table, player_zone_fg_table
 
 
 # -------- helper: collapse ATB areas to L / C / R (keep corners unchanged) --------
-def _collapse_atb_area(area: str) -> str:
-    if area in ("Left Side(L)", "Left Side Center(LC)"):
-        return "Left Side(L)"
-    if area in ("Right Side(R)", "Right Side Center(RC)"):
-        return "Right Side(R)"
-    # includes "Center(C)" itself
-    return "Center(C)"
+_ATB_LEFT = ("Left Side(L)", "Left Side Center(LC)")
+_ATB_RIGHT = ("Right Side(R)", "Right Side Center(RC)")
 
 
-def zone_diff_grid(
+def collapse_atb_vec(area: np.ndarray, is_atb: np.ndarray) -> np.ndarray:
+    """
+    Collapse Above-the-Break areas to L / C / R in one np.select pass.
+    Only positions where `is_atb` is True are rewritten; everything else
+    (corners, paint, mid-range lanes) passes through unchanged.
+    """
+    conds = [
+        is_atb & np.isin(area, _ATB_LEFT),
+        is_atb & np.isin(area, _ATB_RIGHT),
+        is_atb,  # any other ATB area (includes "Center(C)" itself)
+    ]
+    choices = ["Left Side(L)", "Right Side(R)", "Center(C)"]
+    return np.select(conds, choices, default=area)
+
+
+def _hash_df(df: pd.DataFrame) -> str:
+    """Content fingerprint for st.cache_data keys (default hashing re-pickles)."""
+    return hashlib.sha1(
+        pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+    ).hexdigest()
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_df})
+def _zone_diff_grid_core(
     player_df: pd.DataFrame,
     league_df: pd.DataFrame,
-    bin_ft: float = 2.0,
-    return_labels: bool = False,
-    return_text: bool = False
-) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | tuple:
+    bin_ft: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
-    Build a 2D grid across half-court, assigning each bin the FG% difference
-    (player - league average) based on SHOT_ZONE_BASIC × SHOT_ZONE_AREA.
-
-    Returns:
-        X, Y, Zdiff, [labels], [hover_text]  (depending on flags)
+    Cached heavy lifting for zone_diff_grid: always returns the full
+    (X, Y, Zdiff, labels, hover_text) tuple so every flag combination shares
+    one cache entry per (filtered player_df, league_df, bin_ft).
     """
     # --- 1) Compute FG% by zone for player and league (then collapse ATB areas)
     lg = league_zone_fg_table(league_df).copy()   # cols: SHOT_ZONE_BASIC, SHOT_ZONE_AREA, league_fg
@@ -47,23 +64,18 @@ def zone_diff_grid(
     pl = pl[~pl["SHOT_ZONE_AREA"].isin(bad_areas)].copy()
 
     # Collapse ATB areas in PLAYER table: re-aggregate made/att, then recompute player_fg
-    pl["SHOT_ZONE_AREA"] = pl.apply(
-        lambda r: _collapse_atb_area(r["SHOT_ZONE_AREA"]) if r["SHOT_ZONE_BASIC"] == "Above the Break 3"
-        else r["SHOT_ZONE_AREA"],
-        axis=1
-    )
+    pl_atb = pl["SHOT_ZONE_BASIC"].to_numpy() == "Above the Break 3"
+    pl["SHOT_ZONE_AREA"] = collapse_atb_vec(pl["SHOT_ZONE_AREA"].to_numpy(), pl_atb)
     pl = (
         pl.groupby(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"], as_index=False)
           .agg(att=("att", "sum"), made=("made", "sum"))
     )
-    pl["player_fg"] = pl.apply(lambda r: (r["made"] / r["att"]) if r["att"] > 0 else 0.0, axis=1)
+    att = pl["att"].to_numpy(dtype=float)
+    pl["player_fg"] = np.where(att > 0, pl["made"].to_numpy(dtype=float) / np.maximum(att, 1.0), 0.0)
 
     # Collapse ATB areas in LEAGUE table: average league_fg after collapsing
-    lg["SHOT_ZONE_AREA"] = lg.apply(
-        lambda r: _collapse_atb_area(r["SHOT_ZONE_AREA"]) if r["SHOT_ZONE_BASIC"] == "Above the Break 3"
-        else r["SHOT_ZONE_AREA"],
-        axis=1
-    )
+    lg_atb = lg["SHOT_ZONE_BASIC"].to_numpy() == "Above the Break 3"
+    lg["SHOT_ZONE_AREA"] = collapse_atb_vec(lg["SHOT_ZONE_AREA"].to_numpy(), lg_atb)
     lg = (
         lg.groupby(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"], as_index=False)
           .agg(league_fg=("league_fg", "mean"))
@@ -74,53 +86,74 @@ def zone_diff_grid(
     zt["league_fg"] = zt["league_fg"].fillna(zt["player_fg"])  # fallback if missing
     zt["diff"] = zt["player_fg"] - zt["league_fg"]
 
-    # --- 2) Lookups (based on collapsed keys)
-    zone_to_diff   = {(r["SHOT_ZONE_BASIC"], r["SHOT_ZONE_AREA"]): float(r["diff"])       for _, r in zt.iterrows()}
-    zone_to_player = {(r["SHOT_ZONE_BASIC"], r["SHOT_ZONE_AREA"]): float(r["player_fg"])  for _, r in zt.iterrows()}
-    zone_to_league = {(r["SHOT_ZONE_BASIC"], r["SHOT_ZONE_AREA"]): float(r["league_fg"])  for _, r in zt.iterrows()}
+    # --- 2) Lookup table (based on collapsed keys): one MultiIndex reindex
+    # projects all grid cells at once instead of per-cell dict.get calls
+    zt_idx = zt.set_index(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"])[["diff", "player_fg", "league_fg"]]
 
     # --- 3) Grid
     x_centers = np.arange(bin_ft / 2, COURT_LENGTH_HALF, bin_ft)
     y_centers = np.arange(-COURT_WIDTH / 2 + bin_ft / 2, COURT_WIDTH / 2, bin_ft)
-    X, Y = np.meshgrid(x_centers, y_centers)
-    Zdiff  = np.zeros_like(X, dtype=float)
-    labels = np.empty_like(X, dtype=object)
-    hover_text = np.empty_like(X, dtype=object) if return_text else None
-
-    # --- 4) Assign
-    for i in range(Zdiff.shape[0]):
-        for j in range(Zdiff.shape[1]):
-            x, y = float(X[i, j]), float(Y[i, j])
-
-            basic = classify_basic_zone(x, y, pad_ft=bin_ft / 2.0)  # keep the half-bin pad
-
-            # Paint (and RA) should use Center(C) to match tables
-            if basic in ("In The Paint (Non-RA)", "Restricted Area"):
-                area = "Center(C)"
-            else:
-                area = classify_area_lane(y)
-                # Collapse Above-the-Break areas to L / C / R
-                if basic == "Above the Break 3":
-                    area = _collapse_atb_area(area)
-
-            key = (basic, area)
-            diff = zone_to_diff.get(key, 0.0)
-            Zdiff[i, j] = diff
-            labels[i, j] = f"{basic}_{area}"
-
-            if return_text:
-                p = zone_to_player.get(key, float("nan"))
-                l = zone_to_league.get(key, float("nan"))
-                hover_text[i, j] = (
-                    f"<b>{basic}</b> — {area}"
-                    f"<br>Player FG%: {p:.1%}"
-                    f"<br>League FG%: {l:.1%}"
-                    f"<br>Δ: {diff:+.1%}"
-                )
-
-    Zdiff = np.nan_to_num(Zdiff, nan=0.0)
-
-    # --- 5) Return according to flags
+    # Sparse meshgrid keeps only the per-axis vectors; dense views are
+    # broadcast (zero-copy) where full matrices are actually needed
+    shape = (y_centers.size, x_centers.size)
+    X, Y = np.meshgrid(x_centers, y_centers, sparse=True)
+
+    # --- 4) Assign: classify every bin center in one vectorized pass
+    xf = np.broadcast_to(X, shape).ravel()
+    yf = np.broadcast_to(Y, shape).ravel()
+    basic_flat, area_flat = classify_grid(xf, yf, pad_ft=bin_ft / 2.0)  # keep the half-bin pad
+
+    # Paint (and RA) should use Center(C) to match tables;
+    # collapse Above-the-Break areas to L / C / R
+    is_atb = basic_flat == "Above the Break 3"
+    area_flat = collapse_atb_vec(area_flat, is_atb).astype(object)
+    area_flat[np.isin(basic_flat, ("In The Paint (Non-RA)", "Restricted Area"))] = "Center(C)"
+
+    labels = np.char.add(np.char.add(basic_flat.astype(str), "_"), area_flat.astype(str)).astype(object)
+
+    flat_keys = pd.MultiIndex.from_arrays([basic_flat, area_flat])
+    looked = zt_idx.reindex(flat_keys)
+    Zdiff = looked["diff"].fillna(0.0).to_numpy()
+
+    # Single zip comprehension over the flat arrays beats an index-by-index
+    # loop; the float formatting itself is all that remains per cell
+    player_flat = looked["player_fg"].to_numpy()
+    league_flat = looked["league_fg"].to_numpy()
+    hover_text = np.asarray([
+        f"<b>{b}</b> — {a}"
+        f"<br>Player FG%: {p:.1%}"
+        f"<br>League FG%: {l:.1%}"
+        f"<br>Δ: {d:+.1%}"
+        for b, a, p, l, d in zip(basic_flat, area_flat, player_flat, league_flat, Zdiff)
+    ], dtype=object)
+
+    Zdiff = np.nan_to_num(Zdiff, nan=0.0).reshape(shape)
+    labels = labels.reshape(shape)
+    hover_text = hover_text.reshape(shape)
+
+    Xd, Yd = np.broadcast_arrays(X, Y)
+    return Xd, Yd, Zdiff, labels, hover_text
+
+
+def zone_diff_grid(
+    player_df: pd.DataFrame,
+    league_df: pd.DataFrame,
+    bin_ft: float = 2.0,
+    return_labels: bool = False,
+    return_text: bool = False
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | tuple:
+    """
+    Build a 2D grid across half-court, assigning each bin the FG% difference
+    (player - league average) based on SHOT_ZONE_BASIC × SHOT_ZONE_AREA.
+
+    Thin dispatcher over the cached core, so Streamlit reruns with unchanged
+    filters skip the whole pipeline.
+
+    Returns:
+        X, Y, Zdiff, [labels], [hover_text]  (depending on flags)
+    """
+    X, Y, Zdiff, labels, hover_text = _zone_diff_grid_core(player_df, league_df, bin_ft)
+
     if return_labels and return_text:
         return X, Y, Zdiff, labels, hover_text
     if return_labels:
@@ -192,17 +225,13 @@ def add_zone_hover_markers(
         y_cent = Y[:, 0]
         dx = float(np.median(np.diff(x_cent))) if x_cent.size > 1 else 2.0
         dy = float(np.median(np.diff(y_cent))) if y_cent.size > 1 else 2.0
-        # Offsets (~1/3 bin) expand the hover footprint without overlapping neighbors too much
-        offs = [(0.0, 0.0), (dx*0.33, 0.0), (-dx*0.33, 0.0), (0.0, dy*0.33), (0.0, -dy*0.33)]
-
-        xs, ys, texts = [], [], []
-        for (ox, oy) in offs:
-            xs.append(xc + ox)
-            ys.append(yc + oy)
-            texts.append(txt)
-        xs = np.concatenate(xs)
-        ys = np.concatenate(ys)
-        texts = sum(texts, [])  # flatten list-of-lists
+        # Offsets (~1/3 bin) expand the hover footprint without overlapping neighbors too much;
+        # one broadcast builds all five copies (and list-repeat is O(n), unlike sum(..., []))
+        offs_x = np.array([0.0, dx * 0.33, -dx * 0.33, 0.0, 0.0])
+        offs_y = np.array([0.0, 0.0, 0.0, dy * 0.33, -dy * 0.33])
+        xs = (offs_x[:, None] + xc[None, :]).ravel()
+        ys = (offs_y[:, None] + yc[None, :]).ravel()
+        texts = txt * 5
     else:
         xs, ys, texts = xc, yc, txt
 
@@ -257,33 +286,63 @@ def add_zone_boundaries_from_labels(
     x_edges = np.concatenate(([x_cent[0] - dx/2], (x_cent[:-1] + x_cent[1:]) / 2, [x_cent[-1] + dx/2]))
     y_edges = np.concatenate(([y_cent[0] - dy/2], (y_cent[:-1] + y_cent[1:]) / 2, [y_cent[-1] + dy/2]))
 
-    ny, nx = labels.shape
-
-    def _add_segment(x0, x1, y0, y1):
-        # optional halo underneath (thicker, white)
-        if halo:
-            fig3d.add_trace(
-                line3d([x0, x1], [y0, y1], [z_up, z_up],
-                       width=width + halo_width_extra, color=halo_color, opacity=halo_opacity)
-            )
-        # main boundary (on top, black)
+    # 4) vectorized neighbor comparison: all boundary cells at once
+    segs_x, segs_y = [], []
+
+    # vertical boundaries: compare (i,j) with (i, j+1)
+    iy, jx = np.nonzero(labels[:, :-1] != labels[:, 1:])
+    if iy.size:
+        xe = x_edges[jx + 1]
+        nan = np.full(iy.shape, np.nan)
+        segs_x.append(np.column_stack([xe, xe, nan]).ravel())
+        segs_y.append(np.column_stack([y_edges[iy], y_edges[iy + 1], nan]).ravel())
+
+    # horizontal boundaries: compare (i,j) with (i+1, j)
+    iy, jx = np.nonzero(labels[:-1, :] != labels[1:, :])
+    if iy.size:
+        ye = y_edges[iy + 1]
+        nan = np.full(iy.shape, np.nan)
+        segs_x.append(np.column_stack([x_edges[jx], x_edges[jx + 1], nan]).ravel())
+        segs_y.append(np.column_stack([ye, ye, nan]).ravel())
+
+    if not segs_x:
+        return
+
+    # 5) one NaN-separated polyline per layer instead of a trace per segment
+    # (Plotly breaks the line at NaN natively)
+    xs = np.concatenate(segs_x)
+    ys = np.concatenate(segs_y)
+    zs = np.full(xs.shape, z_up)
+
+    # optional halo underneath (thicker, white), main boundary (black) on top
+    if halo:
         fig3d.add_trace(
-            line3d([x0, x1], [y0, y1], [z_up, z_up],
-                   width=width, color=color, opacity=1.0)
+            line3d(xs, ys, zs, width=width + halo_width_extra, color=halo_color, opacity=halo_opacity)
         )
+    fig3d.add_trace(line3d(xs, ys, zs, width=width, color=color, opacity=1.0))
+
 
-    # 4) vertical boundaries: compare (i,j) with (i, j+1)
-    for i in range(ny):
-        y0, y1 = y_edges[i], y_edges[i+1]
-        for j in range(nx - 1):
-            if labels[i, j] != labels[i, j+1]:
-                xe = x_edges[j+1]
-                _add_segment(xe, xe, y0, y1)
-
-    # 5) horizontal boundaries: compare (i,j) with (i+1, j)
-    for i in range(ny - 1):
-        ye = y_edges[i+1]
-        for j in range(nx):
-            if labels[i, j] != labels[i+1, j]:
-                x0, x1 = x_edges[j], x_edges[j+1]
-                _add_segment(x0, x1, ye, ye)
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_df})
+def build_heatmap_traces(
+    player_df: pd.DataFrame,
+    league_df: pd.DataFrame,
+    bin_ft: float = 2.0,
+    vlim: float = 0.15,
+) -> list[dict]:
+    """
+    Build the complete hot/cold overlay (surface + hover markers + zone
+    boundaries) as plain trace dicts, memoized on data + scale.
+
+    Keyed separately from the grid cache so widgets that only affect the
+    arcs (sample size, arc colors) reuse the finished traces instead of
+    re-running trace construction on every rerun.
+    """
+    X, Y, Zdiff, labels, hover_text = zone_diff_grid(
+        player_df, league_df, bin_ft=bin_ft, return_labels=True, return_text=True
+    )
+    fig = go.Figure()
+    add_zone_heatmap_surface(fig, X, Y, Zdiff, vlim=vlim, z_lift=0.01, showscale=True)
+    add_zone_hover_markers(fig, X, Y, hover_text, z_up=0.011)
+    add_zone_boundaries_from_labels(fig, X, Y, labels, z_up=0.09, width=3, halo=True)
+    # plain dicts pickle cheaply and re-add cleanly via fig.add_traces
+    return [t.to_plotly_json() for t in fig.data]
@@ -0,0 +1,66 @@
+"""
+Precomputed boolean-mask index for the filter pipeline ("shot index").
+
+A loaded shotlog is immutable for the lifetime of its loaded_key, so the
+per-value masks the sidebar filters need can be built once per dataset and
+AND-ed together on reruns, instead of re-scanning the columns every time a
+widget changes.
+"""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+def _hash_df(df: pd.DataFrame) -> str:
+    """Content fingerprint so the cache keys on data, not object identity."""
+    return hashlib.sha1(
+        pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+    ).hexdigest()
+
+
+def _value_masks(df: pd.DataFrame, col: str) -> dict:
+    """One boolean mask per distinct value of `col` (empty dict if absent)."""
+    if col not in df.columns:
+        return {}
+    s = df[col]
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # compare int8/int16 codes, not Python strings
+        codes = s.cat.codes.to_numpy()
+        return {cat: codes == i for i, cat in enumerate(s.cat.categories)}
+    vals = s.to_numpy()
+    return {v: vals == v for v in pd.unique(s.dropna())}
+
+
+class ShotIndex:
+    """Struct-of-arrays view of one shotlog: masks + raw filter columns."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.n = len(df)
+
+        self.period_masks = {}
+        if "PERIOD" in df.columns:
+            periods = df["PERIOD"].to_numpy()
+            self.period_masks = {int(p): periods == p for p in np.unique(periods)}
+
+        self.make_mask = None
+        self.miss_mask = None
+        if "SHOT_MADE_FLAG" in df.columns:
+            self.make_mask = df["SHOT_MADE_FLAG"].to_numpy() != 0
+            self.miss_mask = ~self.make_mask
+
+        self.venue_masks = _value_masks(df, "VENUE")
+        self.opponent_masks = _value_masks(df, "OPPONENT")
+        self.action_masks = _value_masks(df, "ACTION_TYPE")
+
+        self.shot_distance = (
+            df["SHOT_DISTANCE"].to_numpy() if "SHOT_DISTANCE" in df.columns else None
+        )
+
+
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: _hash_df})
+def build_shot_index(df: pd.DataFrame) -> ShotIndex:
+    """Build (once per dataset) the precomputed masks for `filter_df`."""
+    return ShotIndex(df)
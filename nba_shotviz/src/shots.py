@@ -8,11 +8,17 @@ import numpy as np
 import plotly.graph_objects as go
 
 from .court_geometry import HOOP_X, HOOP_Y, RIM_HEIGHT
+from .shots_numba import sample_arcs
 
 INCHES_TO_FEET = 1 / 10.0
+_REQ_COLS = frozenset(("LOC_X", "LOC_Y"))
 
 def nba_shot_to_court_xy(loc_x_in, loc_y_in):
-    """Convert nba_api LOC_X/LOC_Y (inches, hoop-centered) -> (x,y) feet in our baseline frame."""
+    """
+    Convert nba_api LOC_X/LOC_Y (inches, hoop-centered) -> (x,y) feet in our
+    baseline frame. Scalar convenience wrapper for single-shot callers; the
+    bulk path uses nba_shot_to_court_xy_vec and never pays the float() boxing.
+    """
     x_ft = HOOP_X + loc_y_in * INCHES_TO_FEET   # forward from baseline
     y_ft = loc_x_in * INCHES_TO_FEET            # lateral, centered on hoop
     return float(x_ft), float(y_ft)
@@ -31,6 +37,46 @@ def _apex_by_distance(
     apex = base + slope * d
     return float(np.clip(apex, lo, hi))
 
+def nba_shot_to_court_xy_vec(loc_x_in, loc_y_in):
+    """Array version of nba_shot_to_court_xy: whole columns in two multiplies."""
+    x_ft = HOOP_X + np.asarray(loc_y_in, dtype=np.float64) * INCHES_TO_FEET
+    y_ft = np.asarray(loc_x_in, dtype=np.float64) * INCHES_TO_FEET
+    return x_ft, y_ft
+
+def _apex_by_distance_vec(
+    x0: np.ndarray, y0: np.ndarray, x1: float = HOOP_X, y1: float = HOOP_Y,
+    *, base: float = 10.5, slope: float = 0.30, lo: float = 14.0, hi: float = 19.5
+) -> np.ndarray:
+    """Array version of _apex_by_distance: one hypot/clip over all shots."""
+    d = np.hypot(x1 - x0, y1 - y0)
+    return np.clip(base + slope * d, lo, hi)
+
+# (3, n) quadratic Bernstein bases, cached per sample count so repeated arc
+# builds skip the linspace + polynomial setup entirely
+_BEZIER_BASIS: dict[int, np.ndarray] = {}
+
+def _basis(n: int) -> np.ndarray:
+    B = _BEZIER_BASIS.get(n)
+    if B is None:
+        t = np.linspace(0.0, 1.0, n)
+        omt = 1.0 - t
+        B = np.stack([omt * omt, 2.0 * omt * t, t * t])
+        _BEZIER_BASIS[n] = B
+    return B
+
+def _arc_points(x0, y0, z0, x1, y1, z1, apex_z, n):
+    """Sample one quadratic Bezier arc from (x0,y0,z0) to rim with peak ~ apex_z."""
+    z_m = 2 * apex_z - 0.5 * (z0 + z1)  # ensures t=0.5 ~ apex_z
+
+    xm, ym = (x0 + x1) / 2.0, (y0 + y1) / 2.0
+    b0, b1, b2 = _basis(n)
+
+    x = b0 * x0 + b1 * xm + b2 * x1
+    y = b0 * y0 + b1 * ym + b2 * y1
+    z = b0 * z0 + b1 * z_m + b2 * z1
+    return x, y, z
+
+
 def add_shot_arc(
     fig,
     x0: float, y0: float,
@@ -44,14 +90,7 @@ def add_shot_arc(
     hovertext: Optional[str] = None,
 ):
     """Quadratic Bezier arc from (x0,y0,z0) to rim with peak ~ apex_z."""
-    z_m = 2 * apex_z - 0.5 * (z0 + z1)  # ensures t=0.5 ~ apex_z
-
-    xm, ym = (x0 + x1) / 2.0, (y0 + y1) / 2.0
-    t = np.linspace(0.0, 1.0, n)
-
-    x = (1 - t) ** 2 * x0 + 2 * (1 - t) * t * xm + t ** 2 * x1
-    y = (1 - t) ** 2 * y0 + 2 * (1 - t) * t * ym + t ** 2 * y1
-    z = (1 - t) ** 2 * z0 + 2 * (1 - t) * t * z_m + t ** 2 * z1
+    x, y, z = _arc_points(x0, y0, z0, x1, y1, z1, apex_z, n)
 
     fig.add_trace(go.Scatter3d(
         x=x, y=y, z=z, mode="lines",
@@ -59,7 +98,9 @@ def add_shot_arc(
         opacity=opacity,
         showlegend=False,
         hoverinfo="text" if hovertext else "skip",
-        hovertext=[hovertext] * len(x) if hovertext else None,
+        # a scalar hovertext applies to every vertex; no O(n) list of the
+        # same string
+        hovertext=hovertext if hovertext else None,
     ))
 
 def add_shots_from_df(
@@ -72,55 +113,103 @@ def add_shots_from_df(
     width: int = 6,
     opacity: float = 0.45,
     apex_profile: Optional[Dict[str, float]] = None,
+    dtype=np.float32,
 ) -> int:
     """
     Draw arcs for each shot.
     - If `uniform_color` is provided, use it for all arcs (e.g., heatmap mode).
       Otherwise, color by make/miss (green/red).
     - `apex_profile` may include base, slope, lo, hi for _apex_by_distance.
+    - `dtype` sets the coordinate buffers handed to Plotly; float32 halves the
+      payload shipped to the browser and is plenty for feet-scale coordinates.
     """
-    if df is None or len(df) == 0:
-        return 0
-    if {"LOC_X", "LOC_Y"}.difference(df.columns):
+    if df is None or df.shape[0] == 0 or not _REQ_COLS.issubset(df.columns):
         return 0
 
     if sample and len(df) > sample:
-        df = df.sample(sample, random_state=7)
+        # sample row indices only; the column pulls below take the chosen
+        # rows directly instead of materializing a sub-DataFrame copy
+        keep = np.random.default_rng(7).choice(len(df), size=sample, replace=False)
+        n = sample
+    else:
+        keep = slice(None)
+        n = len(df)
 
     # defaults if not provided
     ap = apex_profile or dict(base=10.5, slope=0.30, lo=14.0, hi=19.5)
 
-    n = 0
-    for _, row in df.iterrows():
-        x0, y0 = nba_shot_to_court_xy(row["LOC_X"], row["LOC_Y"])
-
-        made = bool(row.get("SHOT_MADE_FLAG", 0))
-        apex = _apex_by_distance(x0, y0, **ap) + (make_bonus if made else 0.0)
-
-        if uniform_color:
-            color = uniform_color
-        else:
-            color = "#2ca02c" if made else "#d62728"
-            
-        # Safe extraction
-        action = row.get("ACTION_TYPE", "Unknown")
-        dist   = row.get("SHOT_DISTANCE", None)
-
-        made = bool(row.get("SHOT_MADE_FLAG", 0))
-        result = "MAKE" if made else "MISS"
-
-        # New hover text
-        hover = f"{action} · {dist} · {result}"
-
-
-        add_shot_arc(
-            fig, x0, y0,
-            z0=release_height_ft,
-            apex_z=apex,
-            color=color,
-            width=width,
+    # All arcs in one broadcast: (N,1) control points against a shared (K,)
+    # Bernstein basis, instead of a Python-level Bezier per row.
+    loc_x = df["LOC_X"].to_numpy(dtype=np.float64)[keep]
+    loc_y = df["LOC_Y"].to_numpy(dtype=np.float64)[keep]
+    x0, y0 = nba_shot_to_court_xy_vec(loc_x, loc_y)
+
+    if "SHOT_MADE_FLAG" in df.columns:
+        made = (df["SHOT_MADE_FLAG"].to_numpy() != 0)[keep]
+    else:
+        made = np.zeros(n, dtype=bool)
+
+    apex = _apex_by_distance_vec(x0, y0, **ap)
+    if make_bonus:
+        apex = apex + np.where(made, make_bonus, 0.0)
+
+    z0, z1 = release_height_ft, RIM_HEIGHT
+    zm = 2.0 * apex - 0.5 * (z0 + z1)              # t=0.5 passes ~ apex
+
+    # Adaptive vertex budget: ~3 samples per foot of range so layups stop
+    # paying for logo-three resolution. Quantized to multiples of 32 so each
+    # bucket still evaluates as one batched call against its cached basis.
+    d = np.hypot(HOOP_X - x0, HOOP_Y - y0)
+    n_arc = (np.ceil(np.clip(20.0 + 3.0 * d, 32.0, 160.0) / 32.0) * 32.0).astype(np.intp)
+
+    # Safe extraction for hover text
+    actions = (df["ACTION_TYPE"].to_numpy()[keep] if "ACTION_TYPE" in df.columns
+               else np.full(n, "Unknown", dtype=object))
+    dists = (df["SHOT_DISTANCE"].to_numpy()[keep] if "SHOT_DISTANCE" in df.columns
+             else np.full(n, None, dtype=object))
+    hovers = np.array([
+        f"{a} · {d} · {'MAKE' if m else 'MISS'}"
+        for a, d, m in zip(actions, dists, made)
+    ], dtype=object)
+
+    # One NaN-separated trace per color group (max 3 traces: make/miss/uniform)
+    # — Plotly slows down linearly with trace count, so thousands of per-shot
+    # Scatter3d traces freeze the browser.
+    if uniform_color:
+        color_rows = [(uniform_color, np.arange(n))]
+    else:
+        color_rows = [("#2ca02c", np.flatnonzero(made)),
+                      ("#d62728", np.flatnonzero(~made))]
+
+    for color, rows in color_rows:
+        if rows.size == 0:
+            continue
+        # one batched evaluation per vertex-count bucket; the ragged pieces
+        # still concatenate into a single NaN-separated polyline per color
+        part_x, part_y, part_z, part_txt = [], [], [], []
+        for k in np.unique(n_arc[rows]):
+            sub = rows[n_arc[rows] == k]
+            xs, ys, zs = sample_arcs(x0[sub], y0[sub], zm[sub], z0, z1, _basis(k))
+            if dtype is not None:
+                xs = xs.astype(dtype, copy=False)
+                ys = ys.astype(dtype, copy=False)
+                zs = zs.astype(dtype, copy=False)
+            txt = np.empty((sub.size, k + 1), dtype=object)
+            txt[:, :k] = hovers[sub, None]
+            txt[:, k] = ""  # separator vertex
+            part_x.append(xs.ravel())
+            part_y.append(ys.ravel())
+            part_z.append(zs.ravel())
+            part_txt.append(txt.ravel())
+        fig.add_trace(go.Scatter3d(
+            x=np.concatenate(part_x),
+            y=np.concatenate(part_y),
+            z=np.concatenate(part_z),
+            mode="lines",
+            line=dict(width=width, color=color),
             opacity=opacity,
-            hovertext=hover,
-        )
-        n += 1
+            showlegend=False,
+            hoverinfo="text",
+            hovertext=np.concatenate(part_txt).tolist(),
+        ))
     return n
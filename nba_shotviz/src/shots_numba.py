@@ -0,0 +1,71 @@
+"""
+Optional Numba-accelerated arc sampling.
+
+Exposes sample_arcs(x0, y0, zm, z0, z1, basis) which evaluates every quadratic
+Bezier arc into (N, K+1) coordinate buffers with a NaN separator in the last
+column, ready to be row-indexed and raveled into one polyline per color group.
+When numba is installed the evaluation runs as a single JIT-compiled native
+loop that fuses the basis products and the separator write; otherwise we fall
+back to the matmul formulation in `shots`, so numba stays an optional
+dependency.
+"""
+
+import numpy as np
+
+from .court_geometry import HOOP_X, HOOP_Y
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+if _HAVE_NUMBA:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _sample_arcs_kernel(x0, y0, zm, z0, z1, b0, b1, b2):
+        n = x0.size
+        k = b0.size
+        X = np.empty((n, k + 1))
+        Y = np.empty((n, k + 1))
+        Z = np.empty((n, k + 1))
+        for i in prange(n):
+            xm = (x0[i] + HOOP_X) * 0.5
+            ym = (y0[i] + HOOP_Y) * 0.5
+            for j in range(k):
+                X[i, j] = b0[j] * x0[i] + b1[j] * xm + b2[j] * HOOP_X
+                Y[i, j] = b0[j] * y0[i] + b1[j] * ym + b2[j] * HOOP_Y
+                Z[i, j] = b0[j] * z0 + b1[j] * zm[i] + b2[j] * z1
+            X[i, k] = np.nan
+            Y[i, k] = np.nan
+            Z[i, k] = np.nan
+        return X, Y, Z
+
+
+def sample_arcs(x0, y0, zm, z0, z1, basis):
+    """
+    Evaluate all arcs against a shared (3, K) Bernstein basis.
+
+    Returns (X, Y, Z), each (N, K+1) float64 with NaN in the last column so a
+    plain ravel yields a NaN-separated polyline.
+    """
+    if _HAVE_NUMBA:
+        return _sample_arcs_kernel(
+            np.ascontiguousarray(x0, dtype=np.float64),
+            np.ascontiguousarray(y0, dtype=np.float64),
+            np.ascontiguousarray(zm, dtype=np.float64),
+            float(z0), float(z1),
+            basis[0], basis[1], basis[2],
+        )
+
+    # matmul fallback: (N,3) control points per axis, one BLAS product each
+    n = x0.size
+    ones = np.ones(n)
+    xm = (x0 + HOOP_X) / 2.0
+    ym = (y0 + HOOP_Y) / 2.0
+    sep = np.full((n, 1), np.nan)
+    X = np.concatenate([np.stack([x0, xm, HOOP_X * ones], axis=1) @ basis, sep], axis=1)
+    Y = np.concatenate([np.stack([y0, ym, HOOP_Y * ones], axis=1) @ basis, sep], axis=1)
+    Z = np.concatenate([np.stack([z0 * ones, zm, z1 * ones], axis=1) @ basis, sep], axis=1)
+    return X, Y, Z
@@ -12,6 +12,9 @@ Relies on court constants to match NBA dimensions.
 """
 
 import math
+
+import numpy as np
+
 from .court_geometry import (
     HOOP_X, HOOP_Y,
     THREE_PT_RADIUS, THREE_PT_CORNER,
@@ -24,6 +27,20 @@ _X_MEET = HOOP_X + THREE_PT_RADIUS * math.cos(_THETA0)   # where arc meets strai
 # Restricted area radius (feet) and lane half-width
 _RESTRICTED_R = 4.0
 _HALF_PAINT = PAINT_WIDTH / 2.0
+# Squared radii: every distance threshold compares dx*dx+dy*dy directly,
+# skipping the sqrt inside hypot.
+_R_RESTR_SQ = _RESTRICTED_R ** 2
+_R_3PT_SQ = THREE_PT_RADIUS ** 2
+
+# SHOT_ZONE_BASIC labels indexed by the int8 codes the batched classifiers emit
+_BASIC_NAMES = np.array([
+    "Restricted Area",        # 0
+    "In The Paint (Non-RA)",  # 1
+    "Mid-Range",              # 2
+    "Left Corner 3",          # 3
+    "Right Corner 3",         # 4
+    "Above the Break 3",      # 5
+], dtype=object)
 
 # SHOT_ZONE_AREA labels (NBA convention)
 _AREAS = [
@@ -34,6 +51,12 @@ _AREAS = [
     ("Right Side(R)",          15.0,  25.0),
 ]
 
+# Interior lane edges + name table for the branchless searchsorted lookup;
+# anything left of -15 is lane 0 and right of +15 lane 4, so the outer
+# bounds never need clamping.
+_AREA_EDGES = np.array([y0 for _, y0, _ in _AREAS[1:]])
+_AREA_NAMES = np.array([name for name, _, _ in _AREAS], dtype=object)
+
 
 def classify_area_lane(y: float) -> str:
     """
@@ -60,9 +83,10 @@ def classify_basic_zone(x: float, y: float, pad_ft: float = 0.0) -> str:
     pad_ft expands the PAINT rectangle by pad_ft on all sides for grid/bin classification.
     """
     xf = float(x); yf = float(y)
+    d2 = (xf - HOOP_X) ** 2 + (yf - HOOP_Y) ** 2
 
     # Restricted circle (exact, no padding)
-    if math.hypot(xf - HOOP_X, yf - HOOP_Y) <= _RESTRICTED_R:
+    if d2 <= _R_RESTR_SQ:
         return "Restricted Area"
 
     # PAINT rectangle (allow optional padding)
@@ -76,7 +100,47 @@ def classify_basic_zone(x: float, y: float, pad_ft: float = 0.0) -> str:
     if abs(yf) >= THREE_PT_CORNER and xf <= _X_MEET:
         return "Left Corner 3" if yf < 0 else "Right Corner 3"
 
-    if math.hypot(xf - HOOP_X, yf - HOOP_Y) >= THREE_PT_RADIUS:
+    if d2 >= _R_3PT_SQ:
         return "Above the Break 3"
 
     return "Mid-Range"
+
+
+def classify_area_lane_vec(y: np.ndarray) -> np.ndarray:
+    """
+    Array version of classify_area_lane: classify many lateral positions in one pass.
+    """
+    yy = np.asarray(y, dtype=float)
+    # side="right" keeps the half-open [y0, y1) lane convention of the
+    # scalar loop (an exact edge value belongs to the lane on its right).
+    idx = np.searchsorted(_AREA_EDGES, yy, side="right")
+    return _AREA_NAMES[idx]
+
+
+def classify_basic_zone_vec(x: np.ndarray, y: np.ndarray, pad_ft: float = 0.0) -> np.ndarray:
+    """
+    Array version of classify_basic_zone: classify many floor coordinates in one
+    pass using boolean masks instead of per-point Python branches.
+
+    Returns an object array of SHOT_ZONE_BASIC labels.
+    """
+    xf = np.asarray(x, dtype=float)
+    yf = np.asarray(y, dtype=float)
+    d2 = (xf - HOOP_X) ** 2 + (yf - HOOP_Y) ** 2
+
+    ra = d2 <= _R_RESTR_SQ
+    half_paint = _HALF_PAINT + pad_ft
+    paint = (xf >= 0.0 - pad_ft) & (xf <= FT_LINE_X + pad_ft) & (np.abs(yf) <= half_paint)
+    corner = (np.abs(yf) >= THREE_PT_CORNER) & (xf <= _X_MEET)
+    atb = d2 >= _R_3PT_SQ
+
+    # Assign lowest-priority zones first so later masks overwrite them,
+    # mirroring the branch order of the scalar classifier. Working in int8
+    # codes keeps the masked writes on a 1-byte array; strings are resolved
+    # once at the end via a single table take.
+    codes = np.full(xf.shape, 2, dtype=np.int8)             # Mid-Range
+    codes[atb] = 5                                          # Above the Break 3
+    codes[corner] = np.where(yf[corner] < 0, 3, 4)          # Left/Right Corner 3
+    codes[paint] = 1                                        # In The Paint (Non-RA)
+    codes[ra] = 0                                           # Restricted Area
+    return _BASIC_NAMES[codes]
@@ -0,0 +1,79 @@
+"""
+Optional Numba-accelerated grid classification.
+
+Exposes classify_grid(x, y, pad_ft) which maps flattened grid coordinates to
+(SHOT_ZONE_BASIC, SHOT_ZONE_AREA) label arrays. When numba is installed the
+geometric predicates run as a single JIT-compiled native loop emitting small
+integer codes; otherwise we fall back to the vectorized NumPy classifiers in
+`zone_classify`, so numba stays an optional dependency.
+"""
+
+import numpy as np
+
+from .court_geometry import HOOP_X, HOOP_Y, THREE_PT_RADIUS, THREE_PT_CORNER, FT_LINE_X
+from .zone_classify import (
+    _AREAS, _BASIC_NAMES, _HALF_PAINT, _RESTRICTED_R, _X_MEET,
+    classify_basic_zone_vec, classify_area_lane_vec,
+)
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Code -> label tables; the kernel emits int8 codes and strings are resolved
+# only at the final label-building step. Basic-zone codes are shared with
+# zone_classify so both paths agree.
+BASIC_NAMES = _BASIC_NAMES
+AREA_NAMES = np.array([name for name, _, _ in _AREAS], dtype=object)
+
+
+if _HAVE_NUMBA:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _classify_grid_kernel(x, y, pad):
+        n = x.size
+        out_basic = np.empty(n, np.int8)
+        out_area = np.empty(n, np.int8)
+        half_paint = _HALF_PAINT + pad
+        # compare squared distances against squared radii: no sqrt per point
+        r_restr_sq = _RESTRICTED_R * _RESTRICTED_R
+        r_3pt_sq = THREE_PT_RADIUS * THREE_PT_RADIUS
+        for i in prange(n):
+            dx = x[i] - HOOP_X
+            dy = y[i] - HOOP_Y
+            d2 = dx * dx + dy * dy
+            if d2 <= r_restr_sq:
+                out_basic[i] = 0
+            elif (x[i] >= 0.0 - pad) and (x[i] <= FT_LINE_X + pad) and abs(y[i]) <= half_paint:
+                out_basic[i] = 1
+            elif abs(y[i]) >= THREE_PT_CORNER and x[i] <= _X_MEET:
+                out_basic[i] = 3 if y[i] < 0 else 4
+            elif d2 >= r_3pt_sq:
+                out_basic[i] = 5
+            else:
+                out_basic[i] = 2
+
+            # lanes are 10 ft wide starting at -25; right-most inclusive
+            yy = min(25.0, max(-25.0, y[i]))
+            lane = int((yy + 25.0) // 10.0)
+            if lane > 4:
+                lane = 4
+            out_area[i] = lane
+        return out_basic, out_area
+
+
+def classify_grid(x: np.ndarray, y: np.ndarray, pad_ft: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Classify flattened grid coordinates in one pass.
+
+    Returns (basic_labels, area_labels) as object arrays matching the scalar
+    classifiers in `zone_classify`.
+    """
+    if _HAVE_NUMBA:
+        xf = np.ascontiguousarray(x, dtype=np.float64).ravel()
+        yf = np.ascontiguousarray(y, dtype=np.float64).ravel()
+        basic_codes, area_codes = _classify_grid_kernel(xf, yf, float(pad_ft))
+        return BASIC_NAMES[basic_codes], AREA_NAMES[area_codes]
+    return classify_basic_zone_vec(x, y, pad_ft=pad_ft), classify_area_lane_vec(y)
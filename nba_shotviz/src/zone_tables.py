@@ -10,6 +10,7 @@ Zone-level FG% tables for player and league.
 Both functions are defensive about upstream schemas from nba_api.
 """
 
+import numpy as np
 import pandas as pd
 
 
@@ -19,6 +20,27 @@ def _safe_ratio(numer, denom):
     return (numer / denom) if denom > 0 else 0.0
 
 
+def _safe_ratio_vec(numer: pd.Series, denom: pd.Series) -> np.ndarray:
+    """Columnwise _safe_ratio: one NumPy pass instead of a per-row apply."""
+    n = numer.to_numpy(dtype=float)
+    d = denom.to_numpy(dtype=float)
+    return np.where(d > 0, n / np.maximum(d, 1.0), 0.0)
+
+
+def _as_zone_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ensure the two zone keys are categorical so groupby hashes int codes
+    instead of strings. Frames from data_io already arrive this way; this
+    covers callers passing raw object columns.
+    """
+    cast = {
+        col: df[col].astype("category")
+        for col in ("SHOT_ZONE_BASIC", "SHOT_ZONE_AREA")
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype)
+    }
+    return df.assign(**cast) if cast else df
+
+
 def player_zone_fg_table(player_df: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregate player shots into zone-level FG%.
@@ -29,20 +51,32 @@ def player_zone_fg_table(player_df: pd.DataFrame) -> pd.DataFrame:
     if not required.issubset(player_df.columns):
         raise ValueError(f"player_df missing required columns: {required - set(player_df.columns)}")
 
-    # If we don't have SHOT_MADE_FLAG (should exist), fall back to 0 attempts
-    has_flag = "SHOT_MADE_FLAG" in player_df.columns
-    if not has_flag:
-        player_df = player_df.assign(SHOT_MADE_FLAG=0)
+    out_cols = ["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA", "player_fg", "att", "made"]
+    if len(player_df) == 0:
+        return pd.DataFrame(columns=out_cols)
 
+    player_df = _as_zone_categories(player_df)
+
+    # No SHOT_MADE_FLAG (should exist): makes are trivially zero, so count
+    # attempts only and skip the sum aggregation entirely
+    if "SHOT_MADE_FLAG" not in player_df.columns:
+        g = (
+            player_df
+            .groupby(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"], dropna=False, as_index=False, observed=True, sort=False)
+            .agg(att=("SHOT_ZONE_BASIC", "size"))
+        )
+        g["made"] = 0
+        g["player_fg"] = 0.0
+        return g[out_cols]
     g = (
         player_df
-        .groupby(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"], dropna=False, as_index=False)
+        .groupby(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"], dropna=False, as_index=False, observed=True, sort=False)
         .agg(att=("SHOT_MADE_FLAG", "size"),
              made=("SHOT_MADE_FLAG", "sum"))
     )
 
-    g["player_fg"] = g.apply(lambda r: _safe_ratio(r["made"], r["att"]), axis=1)
-    return g[["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA", "player_fg", "att", "made"]]
+    g["player_fg"] = _safe_ratio_vec(g["made"], g["att"])
+    return g[out_cols]
 
 
 def league_zone_fg_table(league_df: pd.DataFrame) -> pd.DataFrame:
@@ -60,34 +94,40 @@ def league_zone_fg_table(league_df: pd.DataFrame) -> pd.DataFrame:
     if not required.issubset(league_df.columns):
         raise ValueError(f"league_df missing required columns: {required - set(league_df.columns)}")
 
+    if len(league_df) == 0:
+        return pd.DataFrame(columns=["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA", "league_fg"])
+
     cols = set(league_df.columns)
+    league_df = _as_zone_categories(league_df)
 
     if {"FGM", "FGA"}.issubset(cols):
         # Pre-aggregated table present
         g = (
             league_df
-            .groupby(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"], dropna=False, as_index=False)
+            .groupby(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"], dropna=False, as_index=False, observed=True, sort=False)
             .agg(FGM=("FGM", "sum"), FGA=("FGA", "sum"))
         )
-        g["league_fg"] = g.apply(lambda r: _safe_ratio(r["FGM"], r["FGA"]), axis=1)
+        g["league_fg"] = _safe_ratio_vec(g["FGM"], g["FGA"])
         return g[["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA", "league_fg"]]
 
     if "FG_PCT" in cols:
         # Already a percentage; average by attempts if available, else mean
         # Prefer weighting by attempts if FGA exists
         if "FGA" in cols:
+            # Attempt-weighted mean without groupby.apply: precompute the
+            # weighted numerator as a column, then two grouped sums and one
+            # vectorized divide.
+            tmp = league_df.assign(_wfg=league_df["FG_PCT"] * league_df["FGA"])
             g = (
-                league_df
-                .groupby(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"], dropna=False, as_index=False)
-                .apply(lambda df: pd.Series({
-                    "league_fg": (df["FG_PCT"] * df["FGA"]).sum() / max(df["FGA"].sum(), 1.0)
-                }))
-                .reset_index(drop=True)
+                tmp
+                .groupby(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"], dropna=False, as_index=False, observed=True, sort=False)
+                .agg(_num=("_wfg", "sum"), _den=("FGA", "sum"))
             )
+            g["league_fg"] = g["_num"].to_numpy() / np.maximum(g["_den"].to_numpy(dtype=float), 1.0)
         else:
             g = (
                 league_df
-                .groupby(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"], dropna=False, as_index=False)
+                .groupby(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"], dropna=False, as_index=False, observed=True, sort=False)
                 .agg(league_fg=("FG_PCT", "mean"))
             )
         return g[["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA", "league_fg"]]
@@ -96,11 +136,11 @@ def league_zone_fg_table(league_df: pd.DataFrame) -> pd.DataFrame:
         # One row per shot; compute FG% directly
         g = (
             league_df
-            .groupby(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"], dropna=False, as_index=False)
+            .groupby(["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA"], dropna=False, as_index=False, observed=True, sort=False)
             .agg(att=("SHOT_MADE_FLAG", "size"),
                  made=("SHOT_MADE_FLAG", "sum"))
         )
-        g["league_fg"] = g.apply(lambda r: _safe_ratio(r["made"], r["att"]), axis=1)
+        g["league_fg"] = _safe_ratio_vec(g["made"], g["att"])
         return g[["SHOT_ZONE_BASIC", "SHOT_ZONE_AREA", "league_fg"]]
 
     # If we reach here, we couldn't resolve the schema; return empty sane default
@@ -7,12 +7,7 @@ import plotly.graph_objects as go
 
 from .court_geometry import build_court_figure
 from .shots import add_shots_from_df
-from .heatmap import (
-    zone_diff_grid,
-    add_zone_heatmap_surface,
-    add_zone_boundaries_from_labels,
-    add_zone_hover_markers,   # <-- import the hover layer
-)
+from .heatmap import build_heatmap_traces
 
 def render_3d_trajectories(
     df,
@@ -23,27 +18,18 @@ def render_3d_trajectories(
     force_make_miss_colors: bool = False,
 
 ):
-    fig = build_court_figure()
+    # shallow clone of the cached static court so we never mutate the cache entry
+    fig = go.Figure(build_court_figure())
+
 
     if overlay_heatmap:
         if league_df is None or league_df.empty:
             st.warning("League averages missing; cannot render hot/cold zones.")
         else:
-            # 1) Build the heatmap grid + labels + hover text
-            X, Y, Zdiff, labels, htext = zone_diff_grid(
-                df, league_df, bin_ft=2.0, return_labels=True, return_text=True
-            )
-
-            # 2) Add the color surface (hover disabled on the surface)
-            add_zone_heatmap_surface(
-                fig, X, Y, Zdiff, vlim=vlim, z_lift=0.01, showscale=True
-            )
-
-            # 3) Add invisible hover markers at cell centers
-            add_zone_hover_markers(fig, X, Y, htext, z_up=0.011)
-
-            # 4) Draw crisp zone boundaries on top
-            add_zone_boundaries_from_labels(fig, X, Y, labels, z_up=0.09, width=3, halo=True)
+            # Surface + hover markers + zone boundaries, memoized on
+            # (df, league_df, bin_ft, vlim) so arc-only widget changes reuse
+            # the finished traces.
+            fig.add_traces(build_heatmap_traces(df, league_df, bin_ft=2.0, vlim=vlim))
 
         # When heatmap is on:
         # - if force_make_miss_colors=True -> red/green arcs
@@ -69,4 +55,6 @@ def render_3d_trajectories(
         )
         st.caption(f"Rendering {added} shots")
 
-    st.plotly_chart(fig, use_container_width=True)
+    # stable key -> Streamlit reuses the same chart iframe across reruns,
+    # which pairs with layout.uirevision to preserve the camera
+    st.plotly_chart(fig, use_container_width=True, key="court_chart")